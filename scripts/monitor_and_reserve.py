@@ -1,15 +1,28 @@
 """Poll Korail for seats and reserve when available."""
 
 import argparse
+import asyncio
+import base64
+import functools
+import hashlib
+import heapq
+import json
 import logging
 import os
+import queue
 import random
+import re
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import Optional
 
 import requests
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 
 from korail2 import (
     Korail,
@@ -30,10 +43,40 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(message)s",
 )
 
+# Reuse one keep-alive connection to api.telegram.org across notifications.
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+)
+_TG_URLS = {}
+
+# Notifications are sent by a daemon thread so they stay off the reserve path.
+_NOTIFY_Q = queue.Queue()
+_NOTIFY_THREAD: Optional[threading.Thread] = None
+_NOTIFY_FLUSH_TIMEOUT = 15
+
+# Encrypted login cookies, reused across restarts to skip the login round trip.
+_SESSION_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "korail2", "session.json"
+)
+_SESSION_TTL = 30 * 60
+# Re-save while polling so saved_at tracks the last use, not the last login.
+_SESSION_REFRESH = 5 * 60
+
+# Upper bound for any sleep between polls, matching the --interval clamp.
+_MAX_POLL_DELAY = 300
+
+# Skip trains that just answered SoldOutError instead of retrying every poll.
+_SOLD_OUT_TTL = 30
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+_TIME_RE = re.compile(r"([01]\d|2[0-3])[0-5]\d[0-5]\d")
+_DATE_RE = re.compile(r"\d{4}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])")
+
 
 def normalize_id(raw_id: str) -> str:
     """Normalize phone-like IDs to ###-####-#### for Korail."""
-    digits = "".join(ch for ch in raw_id if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", raw_id)
     if len(digits) == 11:
         return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
     return raw_id
@@ -61,13 +104,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--arr", default="광명", help="Arrival station (default: 광명)")
     parser.add_argument(
         "--date",
-        default=datetime.now().strftime("%Y%m%d"),
+        default=None,
         help="Date YYYYMMDD (default: today)",
     )
     parser.add_argument(
         "--time",
         dest="dep_time",
-        default=datetime.now().strftime("%H%M%S"),
+        default=None,
         help="Start time HHMMSS search cursor (default: now)",
     )
     parser.add_argument(
@@ -87,7 +130,19 @@ def parse_args() -> argparse.Namespace:
         help="Max trains (earliest first) to attempt per poll cycle after filtering by general seats",
     )
     parser.add_argument(
-        "--interval", type=int, default=3, help="Polling interval seconds"
+        "--interval",
+        "--burst-interval",
+        dest="interval",
+        type=int,
+        default=3,
+        help="Polling interval seconds while seat inventory is changing",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=int,
+        default=None,
+        help="Slower polling interval seconds while nothing changes, e.g. 60 "
+        "(default: same as --interval)",
     )
     parser.add_argument(
         "--jitter",
@@ -110,15 +165,136 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable Telegram notify even if env/token is set",
     )
+    parser.add_argument(
+        "--no-session-cache",
+        action="store_true",
+        help="Always log in fresh instead of reusing ~/.cache/korail2/session.json",
+    )
     return parser.parse_args()
 
 
+def _session_cipher(korail: Korail, iv: bytes):
+    secret = f"{korail.korail_id}\0{korail.korail_pw}".encode("utf-8")
+    return AES.new(hashlib.sha256(secret).digest(), AES.MODE_CBC, iv)
+
+
+def _save_session(korail: Korail, path: Optional[str]) -> None:
+    """Persist the logged-in cookies, encrypted with the account credentials."""
+    if not path:
+        return
+    payload = {
+        "korail_id": korail.korail_id,
+        "saved_at": time.time(),
+        "key": korail._key,
+        "membership_number": korail.membership_number,
+        "name": korail.name,
+        "email": korail.email,
+        "cookies": [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+            for c in korail._session.cookies
+        ],
+    }
+    iv = os.urandom(AES.block_size)
+    data = _session_cipher(korail, iv).encrypt(
+        pad(json.dumps(payload).encode("utf-8"), AES.block_size)
+    )
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "iv": base64.b64encode(iv).decode("ascii"),
+                    "data": base64.b64encode(data).decode("ascii"),
+                },
+                f,
+            )
+        os.chmod(path, 0o600)
+    except OSError as exc:  # pragma: no cover
+        logger.warning("Could not save session cache: %s", exc)
+
+
+def _restore_session(korail: Korail, path: Optional[str]) -> bool:
+    """Attach cached cookies to ``korail`` if a fresh cache for this ID exists."""
+    if not path:
+        return False
+    try:
+        with open(path) as f:
+            blob = json.load(f)
+        iv = base64.b64decode(blob["iv"])
+        data = base64.b64decode(blob["data"])
+        payload = json.loads(
+            unpad(_session_cipher(korail, iv).decrypt(data), AES.block_size)
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    if payload.get("korail_id") != korail.korail_id:
+        return False
+    if time.time() - payload.get("saved_at", 0) > _SESSION_TTL:
+        return False
+
+    for c in payload["cookies"]:
+        korail._session.cookies.set(
+            c["name"], c["value"], domain=c["domain"], path=c["path"]
+        )
+    korail._key = payload["key"]
+    korail.membership_number = payload["membership_number"]
+    korail.name = payload["name"]
+    korail.email = payload["email"]
+    korail.logined = True
+    return True
+
+
+def _drop_session_cache(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _resume_session(korail: Korail, path: Optional[str]) -> bool:
+    """Restore a cached session and confirm it with ``korail.reservations()``.
+
+    Any failure drops the cache and returns False so the caller logs in.
+    """
+    if not _restore_session(korail, path):
+        return False
+    try:
+        korail.reservations()
+    except Exception as exc:
+        logger.info("Cached Korail session unusable (%r), logging in again.", exc)
+        _drop_session_cache(path)
+        korail.logined = False
+        korail._key = Korail._key
+        return False
+    _save_session(korail, path)
+    return True
+
+
+def _refresh_session(korail: Korail, path: Optional[str], saved_at: float) -> float:
+    """Re-save the session cache every ``_SESSION_REFRESH`` seconds."""
+    now = time.monotonic()
+    if path and now - saved_at >= _SESSION_REFRESH:
+        _save_session(korail, path)
+        return now
+    return saved_at
+
+
 def _validate_time(dep_time: str) -> str:
-    return datetime.strptime(dep_time, "%H%M%S").strftime("%H%M%S")
+    if not _TIME_RE.fullmatch(dep_time):
+        raise ValueError(f"time {dep_time!r} does not match format HHMMSS")
+    return dep_time
 
 
 def _validate_date(dep_date: str) -> str:
-    return datetime.strptime(dep_date, "%Y%m%d").strftime("%Y%m%d")
+    if not _DATE_RE.fullmatch(dep_date):
+        raise ValueError(f"date {dep_date!r} does not match format YYYYMMDD")
+    # The regex only bounds each field; strptime rejects dates like 20250231.
+    # This runs once before polling, so it costs nothing in the loop.
+    datetime.strptime(dep_date, "%Y%m%d")
+    return dep_date
 
 
 def poll_and_reserve(
@@ -133,7 +309,182 @@ def poll_and_reserve(
     telegram_token: Optional[str] = None,
     telegram_chat_id: Optional[str] = None,
     jitter: float = 0.0,
+    watch_interval: Optional[int] = None,
+    session_cache: Optional[str] = None,
 ):
+    return asyncio.run(
+        poll_and_reserve_async(
+            korail,
+            dep,
+            arr,
+            date,
+            dep_time,
+            limit,
+            interval,
+            end_time,
+            telegram_token=telegram_token,
+            telegram_chat_id=telegram_chat_id,
+            jitter=jitter,
+            watch_interval=watch_interval,
+            session_cache=session_cache,
+        )
+    )
+
+
+class _Cadence:
+    """Slow "watch" polling that bursts to ``interval`` when seats change.
+
+    Korail offers no push or long-poll endpoint, so inventory changes are
+    detected by fingerprinting the seated trains of each search. A new
+    fingerprint switches to the burst interval for ``BURST_SECONDS``.
+    """
+
+    BURST_SECONDS = 5 * 60
+
+    def __init__(self, interval: int, watch_interval: Optional[int] = None):
+        self.burst_interval = interval
+        self.watch_interval = max(interval, min(watch_interval or interval, 300))
+        self._burst_until = 0.0
+        self._seen = None
+
+    @property
+    def bursting(self) -> bool:
+        return time.monotonic() < self._burst_until
+
+    @property
+    def interval(self) -> int:
+        if self.bursting:
+            return self.burst_interval
+        return self.watch_interval
+
+    def observe(self, trains) -> bool:
+        """Record a search result; return True if new seats appeared."""
+        seen = {(t.train_no, t.dep_time) for t in trains if t.has_seat()}
+        changed = self._seen is not None and not seen <= self._seen
+        self._seen = seen
+        if changed:
+            if self.interval != self.burst_interval:
+                logger.info(
+                    "Seat inventory changed, polling every %ss for %s min.",
+                    self.burst_interval,
+                    self.BURST_SECONDS // 60,
+                )
+            self._burst_until = time.monotonic() + self.BURST_SECONDS
+        return changed
+
+
+def _search_or_empty(korail: Korail, *args, **kwargs):
+    try:
+        return korail.search_train(*args, **kwargs)
+    except NoResultsError:
+        return []
+
+
+def _recently_sold_out(sold_out, train, now: float) -> bool:
+    expires_at = sold_out.get(train.train_no)
+    if expires_at is None:
+        return False
+    if expires_at <= now:
+        del sold_out[train.train_no]
+        return False
+    return True
+
+
+def _departure_key(train):
+    return (train.dep_date, train.dep_time)
+
+
+def _tune_korail_session(korail: Korail, limit: int) -> None:
+    """Pool one keep-alive connection per concurrent reserve; retry connects only."""
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=0,
+        other=0,
+        respect_retry_after_header=False,
+        backoff_factor=0.3,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(limit, DEFAULT_POOLSIZE),
+        max_retries=retry,
+    )
+    korail._session.mount("http://", adapter)
+    korail._session.mount("https://", adapter)
+
+
+async def _reserve_first(korail: Korail, trains, sold_out=None):
+    """Reserve all candidates concurrently and keep the earliest success.
+
+    Returns ``(train, reservation, uncancelled)``; ``uncancelled`` lists extra
+    reservations whose cancel failed. Sold-out trains are recorded in
+    ``sold_out``. Raises ``SoldOutError`` if all are sold out, else the first
+    other error.
+    """
+    loop = asyncio.get_running_loop()
+    calls = []
+    for train in trains:
+        logger.info("Trying %s", train)
+        call = functools.partial(
+            korail.reserve, train, option=ReserveOption.GENERAL_ONLY
+        )
+        calls.append(loop.run_in_executor(None, call))
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    winner = None
+    error = None
+    extras = []
+    for train, result in zip(trains, results):
+        if isinstance(result, SoldOutError):
+            logger.info("Sold out while reserving %s, moving on...", train)
+            if sold_out is not None:
+                sold_out[train.train_no] = time.monotonic() + _SOLD_OUT_TTL
+        elif isinstance(result, Exception):
+            if error is None:
+                error = result
+        elif winner is None:
+            winner = (train, result)
+        else:
+            extras.append(result)
+
+    uncancelled = []
+    for extra in extras:
+        logger.info("Cancelling extra reservation %s", extra)
+        try:
+            await loop.run_in_executor(None, korail.cancel, extra)
+        except Exception as exc:
+            logger.error(
+                "Failed to cancel extra reservation %s, cancel it manually: %s",
+                extra,
+                exc,
+            )
+            uncancelled.append(extra)
+
+    if winner is not None:
+        return winner + (uncancelled,)
+    if error is not None:
+        raise error
+    raise SoldOutError()
+
+
+async def poll_and_reserve_async(
+    korail: Korail,
+    dep: str,
+    arr: str,
+    date: str,
+    dep_time: str,
+    limit: int,
+    interval: int,
+    end_time: Optional[str] = None,
+    telegram_token: Optional[str] = None,
+    telegram_chat_id: Optional[str] = None,
+    jitter: float = 0.0,
+    watch_interval: Optional[int] = None,
+    session_cache: Optional[str] = None,
+):
+    loop = asyncio.get_running_loop()
     dep = dep.strip()
     arr = arr.strip()
     date = _validate_date(date.strip())
@@ -141,9 +492,14 @@ def poll_and_reserve(
     end_time = _validate_time(end_time.strip()) if end_time else None
     interval = max(3, min(interval, 300))
     jitter = max(0.0, min(float(jitter), 5.0))
+    cadence = _Cadence(interval, watch_interval)
+    _tune_korail_session(korail, limit)
 
     attempt = 0
     relogin_attempts = 0
+    backoff_attempt = 0
+    recent_sold_out = {}
+    session_saved_at = time.monotonic()
     while True:
         attempt += 1
         logger.info(
@@ -156,39 +512,51 @@ def poll_and_reserve(
             limit,
         )
         try:
-            trains = korail.search_train(dep, arr, date, dep_time)
-            if end_time:
-                trains = [t for t in trains if t.dep_time <= end_time]
+            trains = await loop.run_in_executor(
+                None, _search_or_empty, korail, dep, arr, date, dep_time
+            )
+            if cadence.observe(trains):
+                backoff_attempt = 0
+            session_saved_at = _refresh_session(
+                korail, session_cache, session_saved_at
+            )
             # Keep earliest trains that have general seats.
-            trains = [t for t in trains if t.has_general_seat()]
-            trains.sort(key=lambda t: (t.dep_date, t.dep_time))
-            trains = trains[:limit]
+            now = time.monotonic()
+            trains = heapq.nsmallest(
+                limit,
+                (
+                    t
+                    for t in trains
+                    if (not end_time or t.dep_time <= end_time)
+                    and t.has_general_seat()
+                    and not _recently_sold_out(recent_sold_out, t, now)
+                ),
+                key=_departure_key,
+            )
             if not trains:
                 raise NoResultsError()
-            for train in trains:
-                logger.info("Trying %s", train)
-                try:
-                    reservation = korail.reserve(
-                        train, option=ReserveOption.GENERAL_ONLY
-                    )
-                    logger.info(
-                        "Reserved! ID=%s, train=%s",
-                        getattr(reservation, "rsv_id", None),
-                        reservation,
-                    )
-                    if telegram_token and telegram_chat_id:
-                        _notify_telegram(
-                            telegram_token,
-                            telegram_chat_id,
-                            f"Korail reserved: {dep}->{arr} {date} {train.dep_time}\n{reservation}",
-                        )
-                    return reservation
-                except SoldOutError:
-                    logger.info("Sold out while reserving candidate, moving on...")
-                    continue
+            backoff_attempt = 0
+            train, reservation, uncancelled = await _reserve_first(
+                korail, trains, recent_sold_out
+            )
+            _log_reserved(reservation)
+            if telegram_token and telegram_chat_id:
+                text = f"Korail reserved: {dep}->{arr} {date} {train.dep_time}\n{reservation}"
+                if uncancelled:
+                    text += "\n\nWARNING: extra reservations not cancelled:\n"
+                    text += "\n".join(str(r) for r in uncancelled)
+                _notify_telegram(telegram_token, telegram_chat_id, text)
+            return reservation
+        except SoldOutError:
+            logger.info("All candidates sold out, retrying...")
         except NoResultsError:
             logger.info("No seats found.")
+            # Idle polls back off during dry spells but not inside a burst.
+            if not cadence.bursting:
+                backoff_attempt += 1
         except NeedToLoginError:
+            _drop_session_cache(session_cache)
+            backoff_attempt += 1
             relogin_attempts += 1
             if relogin_attempts > 3:
                 logger.error("Re-login failed too many times, aborting.")
@@ -196,13 +564,18 @@ def poll_and_reserve(
             logger.info(
                 "Session expired, re-authenticating (attempt %s)...", relogin_attempts
             )
-            if not korail.login():
+            if not await loop.run_in_executor(None, korail.login):
                 logger.error("Re-login failed, aborting.")
                 sys.exit(1)
+            _save_session(korail, session_cache)
+            session_saved_at = time.monotonic()
         except Exception as exc:  # pragma: no cover - safety net for unexpected issues
             logger.exception("Unexpected error: %s", exc)
+            backoff_attempt += 1
 
-        _sleep_with_jitter(interval, jitter)
+        await asyncio.sleep(
+            _backoff_delay(cadence.interval, jitter, backoff_attempt)
+        )
 
 
 def poll_and_reserve_exact_train(
@@ -215,6 +588,8 @@ def poll_and_reserve_exact_train(
     telegram_token: Optional[str] = None,
     telegram_chat_id: Optional[str] = None,
     jitter: float = 0.0,
+    watch_interval: Optional[int] = None,
+    session_cache: Optional[str] = None,
 ):
     dep = dep.strip()
     arr = arr.strip()
@@ -222,9 +597,14 @@ def poll_and_reserve_exact_train(
     exact_dep_time = _validate_time(exact_dep_time.strip())
     interval = max(3, min(interval, 300))
     jitter = max(0.0, min(float(jitter), 5.0))
+    cadence = _Cadence(interval, watch_interval)
+    _tune_korail_session(korail, 1)
+    target = (date, exact_dep_time, dep, arr)
 
     attempt = 0
     relogin_attempts = 0
+    backoff_attempt = 0
+    session_saved_at = time.monotonic()
     while True:
         attempt += 1
         logger.info(
@@ -236,31 +616,34 @@ def poll_and_reserve_exact_train(
             exact_dep_time,
         )
         try:
-            trains = korail.search_train(
-                dep, arr, date, exact_dep_time, include_no_seats=True
+            trains = _search_or_empty(
+                korail, dep, arr, date, exact_dep_time, include_no_seats=True
+            )
+            if cadence.observe(trains):
+                backoff_attempt = 0
+            session_saved_at = _refresh_session(
+                korail, session_cache, session_saved_at
+            )
+            train = next(
+                (
+                    t
+                    for t in trains
+                    if (t.dep_date, t.dep_time, t.dep_name, t.arr_name) == target
+                ),
+                None,
             )
-            candidates = [
-                t
-                for t in trains
-                if t.dep_date == date
-                and t.dep_time == exact_dep_time
-                and t.dep_name == dep
-                and t.arr_name == arr
-            ]
-            if not candidates:
+            if train is None:
                 raise NoResultsError()
 
-            train = candidates[0]
             logger.info("Found %s", train)
             if not train.has_general_seat():
                 logger.info("No general seats yet, retrying...")
+                if not cadence.bursting:
+                    backoff_attempt += 1
             else:
+                backoff_attempt = 0
                 reservation = korail.reserve(train, option=ReserveOption.GENERAL_ONLY)
-                logger.info(
-                    "Reserved! ID=%s, train=%s",
-                    getattr(reservation, "rsv_id", None),
-                    reservation,
-                )
+                _log_reserved(reservation)
                 if telegram_token and telegram_chat_id:
                     _notify_telegram(
                         telegram_token,
@@ -270,7 +653,11 @@ def poll_and_reserve_exact_train(
                 return reservation
         except NoResultsError:
             logger.info("Exact train not found (or no schedule returned yet).")
+            if not cadence.bursting:
+                backoff_attempt += 1
         except NeedToLoginError:
+            _drop_session_cache(session_cache)
+            backoff_attempt += 1
             relogin_attempts += 1
             if relogin_attempts > 3:
                 logger.error("Re-login failed too many times, aborting.")
@@ -281,18 +668,64 @@ def poll_and_reserve_exact_train(
             if not korail.login():
                 logger.error("Re-login failed, aborting.")
                 sys.exit(1)
+            _save_session(korail, session_cache)
+            session_saved_at = time.monotonic()
         except SoldOutError:
             logger.info("Sold out while reserving, retrying...")
         except Exception as exc:  # pragma: no cover - safety net for unexpected issues
             logger.exception("Unexpected error: %s", exc)
+            backoff_attempt += 1
 
-        _sleep_with_jitter(interval, jitter)
+        _sleep_with_backoff(cadence.interval, jitter, backoff_attempt)
+
+
+def _log_reserved(reservation) -> None:
+    logger.info(
+        "Reserved! ID=%s, train=%s",
+        getattr(reservation, "rsv_id", None),
+        reservation,
+    )
 
 
 def _notify_telegram(token: str, chat_id: str, text: str) -> None:
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
+    """Queue a Telegram message; the worker thread is started on first use."""
+    global _NOTIFY_THREAD
+    if _NOTIFY_THREAD is None:
+        _NOTIFY_THREAD = threading.Thread(
+            target=_notify_worker, name="telegram-notify", daemon=True
+        )
+        _NOTIFY_THREAD.start()
+    _NOTIFY_Q.put((token, chat_id, text))
+
+
+def _notify_worker() -> None:
+    while True:
+        token, chat_id, text = _NOTIFY_Q.get()
+        try:
+            _send_telegram(token, chat_id, text)
+        finally:
+            _NOTIFY_Q.task_done()
+
+
+def _flush_notifications(timeout: float = _NOTIFY_FLUSH_TIMEOUT) -> None:
+    """Wait up to ``timeout`` seconds for queued notifications to be sent."""
+    if _NOTIFY_THREAD is None:
+        return
+    waiter = threading.Thread(target=_NOTIFY_Q.join, daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    if waiter.is_alive():
+        logger.warning("Telegram notify still pending after %ss, giving up.", timeout)
+
+
+def _send_telegram(token: str, chat_id: str, text: str) -> None:
+    url = _TG_URLS.get(token)
+    if url is None:
+        url = _TG_URLS[token] = f"https://api.telegram.org/bot{token}/sendMessage"
     try:
-        resp = requests.post(url, data={"chat_id": chat_id, "text": text}, timeout=10)
+        resp = _TG_SESSION.post(
+            url, data={"chat_id": chat_id, "text": text}, timeout=10
+        )
         if resp.status_code != 200:
             logger.warning(
                 "Telegram notify failed: %s %s", resp.status_code, resp.text[:200]
@@ -301,11 +734,30 @@ def _notify_telegram(token: str, chat_id: str, text: str) -> None:
         logger.warning("Telegram notify error: %s", exc)
 
 
-def _sleep_with_jitter(interval: int, jitter: float) -> None:
+def _jitter_delay(interval: int, jitter: float) -> float:
     sleep_for = float(interval)
     if jitter > 0:
         sleep_for += random.uniform(-jitter, jitter)
-    time.sleep(max(0.1, sleep_for))
+    return max(0.1, sleep_for)
+
+
+def _backoff_delay(interval: int, jitter: float, backoff_attempt: int) -> float:
+    """Exponential backoff with full jitter, capped at 10x interval.
+
+    ``backoff_attempt`` counts consecutive idle (outside a burst) or failed
+    polls; at zero this is the plain ``interval +/- jitter`` sleep. The draw
+    never goes below ``interval`` so the 3 second polling floor still holds,
+    and never above ``_MAX_POLL_DELAY``.
+    """
+    if backoff_attempt <= 0:
+        return min(_jitter_delay(interval, jitter), _MAX_POLL_DELAY)
+    cap = min(interval * 10, _MAX_POLL_DELAY)
+    delay = min(cap, interval * 2 ** min(backoff_attempt, 10))
+    return random.uniform(min(interval, delay), delay)
+
+
+def _sleep_with_backoff(interval: int, jitter: float, backoff_attempt: int) -> None:
+    time.sleep(_backoff_delay(interval, jitter, backoff_attempt))
 
 
 def main() -> None:
@@ -325,36 +777,54 @@ def main() -> None:
         telegram_token = None
         telegram_chat_id = None
 
-    korail = Korail(korail_id, korail_pw, auto_login=True)
-    if not korail.logined:
-        print("Login failed. Check credentials.")
-        sys.exit(1)
+    session_cache = None if args.no_session_cache else _SESSION_CACHE_PATH
+
+    korail = Korail(korail_id, korail_pw, auto_login=False)
+    if _resume_session(korail, session_cache):
+        logger.info("Reusing cached Korail session.")
+    else:
+        korail.login()
+        if not korail.logined:
+            print("Login failed. Check credentials.")
+            sys.exit(1)
+        _save_session(korail, session_cache)
+
+    # Resolve "today"/"now" only after login so slow startups near midnight
+    # do not search with a stale date.
+    now = datetime.now()
+    date = args.date or now.strftime("%Y%m%d")
+    dep_time = args.dep_time or now.strftime("%H%M%S")
     if args.exact:
         poll_and_reserve_exact_train(
             korail=korail,
             dep=args.dep,
             arr=args.arr,
-            date=args.date,
-            exact_dep_time=args.dep_time,
+            date=date,
+            exact_dep_time=dep_time,
             interval=args.interval,
             telegram_token=telegram_token,
             telegram_chat_id=telegram_chat_id,
             jitter=args.jitter,
+            watch_interval=args.watch_interval,
+            session_cache=session_cache,
         )
     else:
         poll_and_reserve(
             korail,
             args.dep,
             args.arr,
-            args.date,
-            args.dep_time,
+            date,
+            dep_time,
             args.limit,
             args.interval,
             args.end_time,
             telegram_token=telegram_token,
             telegram_chat_id=telegram_chat_id,
             jitter=args.jitter,
+            watch_interval=args.watch_interval,
+            session_cache=session_cache,
         )
+    _flush_notifications()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,355 @@
+# -*- coding:utf-8 -*-
+import asyncio
+import importlib.util
+import os.path
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from unittest import TestCase, mock
+
+import requests
+
+from korail2 import SoldOutError, KorailError, NeedToLoginError
+
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "monitor_and_reserve.py",
+)
+_spec = importlib.util.spec_from_file_location("monitor_and_reserve", _SCRIPT)
+mar = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mar)
+
+
+class FakeTrain(object):
+
+    def __init__(self, train_no, dep_time, seat=True):
+        self.train_no = train_no
+        self.dep_date = "20261014"
+        self.dep_time = dep_time
+        self.seat = seat
+
+    def has_seat(self):
+        return self.seat
+
+    def has_general_seat(self):
+        return self.seat
+
+    def __repr__(self):
+        return "FakeTrain(%s)" % self.train_no
+
+
+class FakeKorail(object):
+
+    def __init__(self, outcomes, cancel_fails=False):
+        self.outcomes = outcomes
+        self.cancel_fails = cancel_fails
+        self.cancelled = []
+
+    def reserve(self, train, option=None):
+        outcome = self.outcomes[train.train_no]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def cancel(self, rsv):
+        if self.cancel_fails:
+            raise KorailError("cancel failed", "X")
+        self.cancelled.append(rsv)
+
+
+class TestReserveFirst(TestCase):
+
+    def setUp(self):
+        self.trains = [FakeTrain("1", "100000"), FakeTrain("2", "110000"),
+                       FakeTrain("3", "120000")]
+
+    def test_keeps_earliest_success_and_cancels_rest(self):
+        korail = FakeKorail({"1": SoldOutError(), "2": "R2", "3": "R3"})
+        train, rsv, uncancelled = asyncio.run(
+            mar._reserve_first(korail, self.trains))
+        self.assertEqual(train.train_no, "2")
+        self.assertEqual(rsv, "R2")
+        self.assertEqual(korail.cancelled, ["R3"])
+        self.assertEqual(uncancelled, [])
+
+    def test_reports_failed_cancel(self):
+        korail = FakeKorail({"1": "R1", "2": "R2", "3": "R3"}, cancel_fails=True)
+        train, rsv, uncancelled = asyncio.run(
+            mar._reserve_first(korail, self.trains))
+        self.assertEqual(rsv, "R1")
+        self.assertEqual(uncancelled, ["R2", "R3"])
+
+    def test_all_sold_out(self):
+        korail = FakeKorail(dict((t.train_no, SoldOutError()) for t in self.trains))
+        with self.assertRaises(SoldOutError):
+            asyncio.run(mar._reserve_first(korail, self.trains))
+
+    def test_other_error_raised_without_winner(self):
+        korail = FakeKorail({"1": SoldOutError(), "2": KorailError("boom", "E"),
+                             "3": SoldOutError()})
+        with self.assertRaises(KorailError) as cm:
+            asyncio.run(mar._reserve_first(korail, self.trains))
+        self.assertNotIsInstance(cm.exception, SoldOutError)
+
+
+class TestValidate(TestCase):
+
+    def test_date(self):
+        self.assertEqual(mar._validate_date("20240229"), "20240229")
+        for bad in ("20250231", "20250229", "20251301", "2025011", "2025-01-01"):
+            with self.assertRaises(ValueError):
+                mar._validate_date(bad)
+
+    def test_time(self):
+        self.assertEqual(mar._validate_time("235959"), "235959")
+        for bad in ("240000", "126000", "12345", "12:00:00"):
+            with self.assertRaises(ValueError):
+                mar._validate_time(bad)
+
+
+class FakeSessionKorail(object):
+
+    def __init__(self, korail_id="010-1234-5678", korail_pw="pw", expired=False,
+                 error=None):
+        self._session = requests.Session()
+        self.korail_id = korail_id
+        self.korail_pw = korail_pw
+        self.expired = expired
+        self.error = error
+        self._key = None
+        self.membership_number = None
+        self.name = None
+        self.email = None
+        self.logined = False
+
+    def reservations(self):
+        if self.expired:
+            raise NeedToLoginError()
+        if self.error is not None:
+            raise self.error
+        return []
+
+
+class TestSessionCache(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "korail2", "session.json")
+        korail = FakeSessionKorail()
+        korail._key = "key"
+        korail.membership_number = "1234567890"
+        korail._session.cookies.set("JSESSIONID", "abc",
+                                    domain="smart.letskorail.com", path="/")
+        mar._save_session(korail, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_file_is_private(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_restore(self):
+        korail = FakeSessionKorail()
+        self.assertTrue(mar._restore_session(korail, self.path))
+        self.assertTrue(korail.logined)
+        self.assertEqual(korail._key, "key")
+        self.assertEqual(korail.membership_number, "1234567890")
+        self.assertEqual(korail._session.cookies.get("JSESSIONID"), "abc")
+
+    def test_wrong_id_or_password(self):
+        self.assertFalse(mar._restore_session(
+            FakeSessionKorail(korail_id="010-0000-0000"), self.path))
+        self.assertFalse(mar._restore_session(
+            FakeSessionKorail(korail_pw="other"), self.path))
+
+    def test_expired(self):
+        later = mar.time.time() + mar._SESSION_TTL + 1
+        with mock.patch.object(mar.time, "time", return_value=later):
+            self.assertFalse(mar._restore_session(FakeSessionKorail(), self.path))
+
+    def test_disabled(self):
+        self.assertFalse(mar._restore_session(FakeSessionKorail(), None))
+
+    def test_resume_verifies_with_server(self):
+        self.assertTrue(mar._resume_session(FakeSessionKorail(), self.path))
+
+        korail = FakeSessionKorail(expired=True)
+        self.assertFalse(mar._resume_session(korail, self.path))
+        self.assertFalse(korail.logined)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_resume_drops_cache_on_other_errors(self):
+        for error in (KorailError("server error", "E"), ValueError("not json"),
+                      requests.ConnectionError("down")):
+            mar._save_session(FakeSessionKorail(), self.path)
+            korail = FakeSessionKorail(error=error)
+            self.assertFalse(mar._resume_session(korail, self.path))
+            self.assertFalse(korail.logined)
+            self.assertEqual(korail._key, mar.Korail._key)
+            self.assertFalse(os.path.exists(self.path))
+
+    def test_refresh(self):
+        korail = FakeSessionKorail()
+        now = mar.time.monotonic()
+        self.assertEqual(mar._refresh_session(korail, self.path, now), now)
+        stale = now - mar._SESSION_REFRESH
+        self.assertGreater(mar._refresh_session(korail, self.path, stale), stale)
+        self.assertEqual(mar._refresh_session(korail, None, stale), stale)
+
+
+class TestBackoffDelay(TestCase):
+
+    def test_no_backoff_is_plain_interval(self):
+        self.assertEqual(mar._backoff_delay(3, 0.0, 0), 3.0)
+        for _ in range(100):
+            self.assertTrue(2.0 <= mar._backoff_delay(3, 1.0, 0) <= 4.0)
+
+    def test_bounds(self):
+        for attempt in range(1, 30):
+            for _ in range(20):
+                delay = mar._backoff_delay(3, 0.0, attempt)
+                self.assertTrue(3 <= delay <= min(30, 3 * 2 ** attempt))
+
+    def test_never_above_max(self):
+        for attempt in range(0, 30):
+            for _ in range(20):
+                delay = mar._backoff_delay(300, 5.0, attempt)
+                self.assertLessEqual(delay, mar._MAX_POLL_DELAY)
+
+
+class TestCadence(TestCase):
+
+    def test_watch_defaults_to_interval(self):
+        self.assertEqual(mar._Cadence(3).interval, 3)
+        self.assertEqual(mar._Cadence(3, 1000).watch_interval, 300)
+
+    def test_burst_on_new_seats(self):
+        cadence = mar._Cadence(3, 60)
+        t1, t2 = FakeTrain("1", "100000"), FakeTrain("2", "110000")
+        self.assertFalse(cadence.observe([t1]))
+        self.assertEqual(cadence.interval, 60)
+        self.assertFalse(cadence.observe([t1]))
+        self.assertFalse(cadence.observe([]))
+        self.assertEqual(cadence.interval, 60)
+
+        self.assertTrue(cadence.observe([t1, t2]))
+        self.assertEqual(cadence.interval, 3)
+        self.assertFalse(cadence.observe([t1, FakeTrain("3", "120000", seat=False)]))
+
+        later = mar.time.monotonic() + cadence.BURST_SECONDS + 1
+        with mock.patch.object(mar.time, "monotonic", return_value=later):
+            self.assertEqual(cadence.interval, 60)
+
+
+class TestRecentlySoldOut(TestCase):
+
+    def test_ttl_expiry(self):
+        train = FakeTrain("1", "100000")
+        sold_out = {"1": 100.0}
+        self.assertTrue(mar._recently_sold_out(sold_out, train, 99.0))
+        self.assertFalse(mar._recently_sold_out(sold_out, train, 100.0))
+        self.assertEqual(sold_out, {})
+        self.assertFalse(mar._recently_sold_out(sold_out, train, 0.0))
+
+    def test_reserve_first_records_ttl(self):
+        train = FakeTrain("1", "100000")
+        sold_out = {}
+        before = mar.time.monotonic()
+        with self.assertRaises(SoldOutError):
+            asyncio.run(mar._reserve_first(
+                FakeKorail({"1": SoldOutError()}), [train], sold_out))
+        self.assertTrue(before + mar._SOLD_OUT_TTL <= sold_out["1"])
+        self.assertTrue(mar._recently_sold_out(sold_out, train, before))
+
+
+class TestTuneKorailSession(TestCase):
+
+    def test_only_connect_errors_retried(self):
+        korail = FakeKorail({})
+        korail._session = requests.Session()
+        mar._tune_korail_session(korail, 20)
+        adapter = korail._session.get_adapter("https://smart.letskorail.com")
+        retry = adapter.max_retries
+        self.assertEqual(adapter._pool_maxsize, 20)
+        for status in (502, 503, 504):
+            self.assertFalse(retry.is_retry("GET", status, True))
+        self.assertEqual(retry.read, 0)
+        self.assertEqual(retry.connect, 3)
+
+
+class _StopPolling(BaseException):
+    pass
+
+
+class PollingKorail(object):
+
+    def __init__(self, results):
+        self._session = requests.Session()
+        self.results = list(results)
+
+    def search_train(self, *args, **kwargs):
+        return self.results.pop(0) if self.results else []
+
+
+class TestPollBackoff(TestCase):
+
+    def run_polls(self, korail, polls, **kwargs):
+        attempts = []
+
+        def fake_delay(interval, jitter, backoff_attempt):
+            attempts.append(backoff_attempt)
+            if len(attempts) >= polls:
+                raise _StopPolling()
+            return 0
+
+        with mock.patch.object(mar, "_backoff_delay", fake_delay):
+            with self.assertRaises(_StopPolling):
+                asyncio.run(mar.poll_and_reserve_async(
+                    korail, "A", "B", "20261014", "090000", 3, 3, **kwargs))
+        return attempts
+
+    def test_idle_polls_back_off(self):
+        self.assertEqual(self.run_polls(PollingKorail([]), 4), [1, 2, 3, 4])
+
+    def test_burst_polls_do_not_back_off(self):
+        # A seated train past --end-time starts a burst but is never a candidate.
+        late = [FakeTrain("9", "230000")]
+        korail = PollingKorail([[], late, late, late])
+        attempts = self.run_polls(korail, 4, end_time="120000", watch_interval=60)
+        self.assertEqual(attempts, [1, 0, 0, 0])
+
+
+class TestTelegramQueue(TestCase):
+
+    def test_queued_without_blocking_and_flushed(self):
+        sent = []
+
+        def slow_send(token, chat_id, text):
+            time.sleep(0.2)
+            sent.append((token, chat_id, text))
+
+        with mock.patch.object(mar, "_send_telegram", slow_send):
+            start = time.monotonic()
+            mar._notify_telegram("token", "chat", "hello")
+            self.assertLess(time.monotonic() - start, 0.1)
+            self.assertEqual(sent, [])
+            mar._flush_notifications(5)
+        self.assertEqual(sent, [("token", "chat", "hello")])
+
+    def test_flush_gives_up_after_timeout(self):
+        release = threading.Event()
+
+        def hung_send(token, chat_id, text):
+            release.wait(5)
+
+        with mock.patch.object(mar, "_send_telegram", hung_send):
+            mar._notify_telegram("token", "chat", "hello")
+            start = time.monotonic()
+            mar._flush_notifications(0.2)
+            elapsed = time.monotonic() - start
+            release.set()
+            mar._flush_notifications(5)
+        self.assertTrue(0.2 <= elapsed < 1.0)